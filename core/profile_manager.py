@@ -7,6 +7,11 @@ import os
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 
 @dataclass
 class FileRule:
@@ -52,8 +57,9 @@ class LastProfileStore:
     def load(self) -> None:
         try:
             if os.path.exists(self.path):
-                with open(self.path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                with open(self.path, "rb") as f:
+                    raw = f.read()
+                data = orjson.loads(raw) if orjson is not None else json.loads(raw)
                 if isinstance(data, dict):
                     self._map = {str(k): str(v) for k, v in data.items()}
         except Exception:
@@ -62,8 +68,12 @@ class LastProfileStore:
     def save(self) -> None:
         try:
             os.makedirs(os.path.dirname(self.path), exist_ok=True)
-            with open(self.path, "w", encoding="utf-8") as f:
-                json.dump(self._map, f, ensure_ascii=False, indent=2)
+            if orjson is not None:
+                raw = orjson.dumps(self._map, option=orjson.OPT_INDENT_2)
+            else:
+                raw = json.dumps(self._map, ensure_ascii=False, indent=2).encode("utf-8")
+            with open(self.path, "wb") as f:
+                f.write(raw)
         except Exception:
             pass
 
@@ -72,7 +82,10 @@ class LastProfileStore:
         return str(v) if v is not None else None
 
     def set(self, game_id: str, monitor_id: str) -> None:
-        self._map[str(game_id)] = str(monitor_id)
+        key, value = str(game_id), str(monitor_id)
+        if self._map.get(key) == value:
+            return  # relaunch on the same monitor: nothing to persist
+        self._map[key] = value
         self.save()
 
 
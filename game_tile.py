@@ -2,16 +2,50 @@
 from __future__ import annotations
 
 import os
+import math
 from typing import Optional, Any, Dict
 
 from PyQt6 import QtWidgets
 from PyQt6.QtWidgets import QFrame, QLabel, QVBoxLayout, QPushButton, QWidget, QHBoxLayout
-from PyQt6.QtCore import Qt, pyqtSignal, QRect
-from PyQt6.QtGui import QPixmap
+from PyQt6.QtCore import Qt, pyqtSignal, QRect, QObject, QRunnable, QThreadPool
+from PyQt6.QtGui import QPixmap, QPixmapCache, QImage, QImageReader
 
 from translations import tr
 
 
+class _PosterSignals(QObject):
+    loaded = pyqtSignal(str, QImage)  # (request key, image; null if nothing decoded)
+
+
+class PosterLoader(QRunnable):
+    """Decodes the first readable path into a QImage off the UI thread (no QPixmap here)."""
+
+    def __init__(self, key: str, paths: list[str], size: tuple[int, int], signals: _PosterSignals) -> None:
+        super().__init__()
+        self.key = key
+        self.paths = paths
+        self.size = size
+        self.signals = signals
+
+    def run(self) -> None:
+        tw, th = self.size
+        img = QImage()
+        for path in self.paths:
+            if not os.path.exists(path):
+                continue
+            reader = QImageReader(path)
+            src = reader.size()
+            if src.isValid() and src.width() > tw and src.height() > th:
+                reader.setScaledSize(src.scaled(tw, th, Qt.AspectRatioMode.KeepAspectRatioByExpanding))
+            img = reader.read()
+            if not img.isNull():
+                break
+        try:
+            self.signals.loaded.emit(self.key, img)
+        except RuntimeError:
+            pass  # tile destroyed while decoding
+
+
 class GameTile(QFrame):
     # launcher.py ожидает эти сигналы
     clicked = pyqtSignal(object)         # (game_data, profile_key) or game_data
@@ -21,7 +55,7 @@ class GameTile(QFrame):
 
     def __init__(self, game_data: Dict[str, Any], width=220, height=320, get_monitor_name=None):
         super().__init__()
-        self.game_data = game_data
+        self.game_data: Dict[str, Any] = {}
         self.get_monitor_name = get_monitor_name
 
         self.setFixedSize(width, height)
@@ -51,15 +85,12 @@ class GameTile(QFrame):
         bottom_layout.setContentsMargins(8, 6, 8, 6)
         bottom_layout.setSpacing(2)
 
-        self.name_label = QLabel(game_data.get("name", ""))
+        self.name_label = QLabel()
         self.name_label.setStyleSheet("color: white; font-weight: bold;")
         self.name_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.name_label.setWordWrap(True)
 
-        play_time = game_data.get("play_time", "0h")
-        configs_count = sum(len(p.get("configs", [])) for p in game_data.get("monitor_profiles", {}).values())
-
-        self.stats_label = QLabel(f"{play_time}  {tr('configs', configs_count)}")
+        self.stats_label = QLabel()
         self.stats_label.setStyleSheet("color: #aaa; font-size: 11px;")
         self.stats_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
@@ -88,31 +119,12 @@ class GameTile(QFrame):
 
         overlay_layout.addWidget(self.profile_panel)
 
-        # profile buttons
+        # profile buttons (filled in set_game)
         self.profile_buttons: list[QPushButton] = []
-        monitor_profiles = game_data.get("monitor_profiles", {}) or {}
-
-        for key, profile in monitor_profiles.items():
-            mon_id = profile.get("monitor_id")
-            display_name = None
-
-            if self.get_monitor_name and mon_id is not None:
-                display_name = self.get_monitor_name(mon_id)
-
-            if not display_name:
-                display_name = key
-
-            fps_limit = profile.get("fps_limit", 0)
-            fps_method = profile.get("fps_method", "auto")
-
-            btn = QPushButton(f"{display_name}\n{fps_limit} FPS / {fps_method}")
-            btn.setObjectName("profileButton")
-            btn.setMinimumHeight(50)
-            btn.setMinimumWidth(230)
-            btn.clicked.connect(lambda checked=False, k=key: self._emit_launch_profile(k))
-
-            panel_layout.addWidget(btn)
-            self.profile_buttons.append(btn)
+        self.profiles_layout = QVBoxLayout()
+        self.profiles_layout.setContentsMargins(0, 0, 0, 0)
+        self.profiles_layout.setSpacing(10)
+        panel_layout.addLayout(self.profiles_layout)
 
         # action row (Configure / Delete) -> 2 equal columns, no truncation
         action_row = QHBoxLayout()
@@ -139,15 +151,58 @@ class GameTile(QFrame):
 
         panel_layout.addLayout(action_row)
 
-        # load poster
         self._poster_pixmap: Optional[QPixmap] = None
-        self.load_poster()
+        self._poster_key = ""
+        self._poster_signals = _PosterSignals(self)
+        self._poster_signals.loaded.connect(self._on_poster_loaded)
+        self.set_game(game_data)
 
         # enable hover tracking
         self.setMouseTracking(True)
         self.poster_label.setMouseTracking(True)
         self.overlay.setMouseTracking(True)
 
+    # ===== Data binding (tiles are reused by launcher.render_grid) =====
+    def set_game(self, game_data: Dict[str, Any]) -> None:
+        self.game_data = game_data
+
+        self.name_label.setText(game_data.get("name", ""))
+
+        play_time = game_data.get("play_time", "0h")
+        configs_count = sum(len(p.get("configs", [])) for p in game_data.get("monitor_profiles", {}).values())
+        self.stats_label.setText(f"{play_time}  {tr('configs', configs_count)}")
+
+        self._build_profile_buttons(game_data.get("monitor_profiles", {}) or {})
+        self.load_poster()
+
+    def _build_profile_buttons(self, monitor_profiles: Dict[str, Any]) -> None:
+        for btn in self.profile_buttons:
+            self.profiles_layout.removeWidget(btn)
+            btn.deleteLater()
+        self.profile_buttons = []
+
+        for key, profile in monitor_profiles.items():
+            mon_id = profile.get("monitor_id")
+            display_name = None
+
+            if self.get_monitor_name and mon_id is not None:
+                display_name = self.get_monitor_name(mon_id)
+
+            if not display_name:
+                display_name = key
+
+            fps_limit = profile.get("fps_limit", 0)
+            fps_method = profile.get("fps_method", "auto")
+
+            btn = QPushButton(f"{display_name}\n{fps_limit} FPS / {fps_method}")
+            btn.setObjectName("profileButton")
+            btn.setMinimumHeight(50)
+            btn.setMinimumWidth(230)
+            btn.clicked.connect(lambda checked=False, k=key: self._emit_launch_profile(k))
+
+            self.profiles_layout.addWidget(btn)
+            self.profile_buttons.append(btn)
+
     # ===== Signals helpers =====
     def _emit_launch_profile(self, profile_key: str) -> None:
         self.clicked.emit((self.game_data, profile_key))
@@ -160,19 +215,31 @@ class GameTile(QFrame):
     def load_poster(self) -> None:
         self._poster_pixmap = None
 
-        poster_path = self.game_data.get("poster_path", "")
-        if poster_path and os.path.exists(poster_path):
-            pm = QPixmap(poster_path)
-            if not pm.isNull():
+        # poster first, icon as fallback; decoded in PosterLoader unless already cached
+        paths = [p for p in (self.game_data.get("poster_path", ""), self.game_data.get("icon_path", "")) if p]
+        # decode for device pixels so HiDPI screens don't upscale; size is part of the cache key
+        dpr = self.devicePixelRatioF()
+        target = (math.ceil(self.width() * dpr), math.ceil(self.height() * dpr))
+        self._poster_key = "\n".join(paths) + f"\n@{target[0]}x{target[1]}"
+        if paths:
+            pm = QPixmapCache.find(self._poster_key)
+            if pm is not None and not pm.isNull():
                 self._poster_pixmap = pm
-
-        if self._poster_pixmap is None:
-            icon_path = self.game_data.get("icon_path", "")
-            if icon_path and os.path.exists(icon_path):
-                pm = QPixmap(icon_path)
-                if not pm.isNull():
-                    self._poster_pixmap = pm
-
+            else:
+                QThreadPool.globalInstance().start(
+                    PosterLoader(self._poster_key, paths, target, self._poster_signals)
+                )
+        self._show_poster()
+
+    def _on_poster_loaded(self, key: str, img: QImage) -> None:
+        if key != self._poster_key or img.isNull():
+            return  # stale request (tile rebound) or nothing decodable
+        pm = QPixmap.fromImage(img)
+        QPixmapCache.insert(key, pm)
+        self._poster_pixmap = pm
+        self._show_poster()
+
+    def _show_poster(self) -> None:
         if self._poster_pixmap is None:
             self.poster_label.setPixmap(QPixmap())
             self.poster_label.setText("🎮")
@@ -180,6 +247,7 @@ class GameTile(QFrame):
             return
 
         self.poster_label.setText("")
+        self.poster_label.setStyleSheet("")
         self._update_poster()
 
     def _update_poster(self) -> None:
@@ -1,7 +1,6 @@
 import time
-import ctypes
 from PyQt6.QtCore import QThread, pyqtSignal
-from xinput import XINPUT_AVAILABLE, XINPUT_STATE, XInputGetState, ERROR_SUCCESS
+from xinput import XINPUT_AVAILABLE, poll
 
 class GamepadNavigator(QThread):
     """
@@ -47,11 +46,10 @@ class GamepadNavigator(QThread):
         if not XINPUT_AVAILABLE:
             return
 
-        state = XINPUT_STATE()
         while self.running:
             try:
-                res = XInputGetState(self.controller_index, ctypes.byref(state))
-                if res != ERROR_SUCCESS:
+                state = poll(self.controller_index)
+                if state is None:
                     # controller not connected
                     self._hold_action = None
                     time.sleep(0.25)
@@ -179,6 +179,8 @@ class GamepadListenerThread(QThread):
         super().__init__()
         self.config_provider = config_provider
         self.running = True
+        # sleep'ы в run() ждут на этом событии, чтобы stop() будил поток сразу
+        self._stop = threading.Event()
         self.pressed = set()
         self.controller_index = 0
         self.gamepad_available = False
@@ -235,13 +237,13 @@ class GamepadListenerThread(QThread):
                     self.gamepad_available = False
                     break
                 elif result != ERROR_SUCCESS:
-                    time.sleep(2)
+                    self._stop.wait(2)
                     continue
 
                 buttons_mask = state.Gamepad.wButtons
 
                 if buttons_mask == last_buttons:
-                    time.sleep(0.05)
+                    self._stop.wait(0.05)
                     continue
                 last_buttons = buttons_mask
 
@@ -266,14 +268,14 @@ class GamepadListenerThread(QThread):
                     if combo and combo.issubset(self.pressed):
                         self.actionTriggered.emit(act['name'])
                         self.execute_action(act)
-                        time.sleep(1)
+                        self._stop.wait(1)
                         break
 
-                time.sleep(0.05)
+                self._stop.wait(0.05)
 
             except Exception as e:
                 self.statusMessage.emit(f"Ошибка в слушателе: {e}")
-                time.sleep(2)
+                self._stop.wait(2)
 
     def execute_action(self, action_cfg):
         act_type = action_cfg.get('action')
@@ -460,6 +462,7 @@ class GamepadListenerThread(QThread):
 
     def stop(self):
         self.running = False
+        self._stop.set()
 
 
 # ---------- Диалог тестирования геймпада (XInput через ctypes) ----------
@@ -779,6 +782,7 @@ class ConfigWindow(QMainWindow):
         self.setStyleSheet("background-color: #0e1115; color: white;")
 
         self.config = load_config()
+        self._last_cfg_hash = None
 
         central = QWidget()
         self.setCentralWidget(central)
@@ -863,8 +867,15 @@ class ConfigWindow(QMainWindow):
                 actions.append(widget.get_data())
         self.config['actions'] = actions
         try:
-            with open(CONFIG_PATH, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=4, ensure_ascii=False)
+            data = json.dumps(self.config, indent=4, ensure_ascii=False)
+            h = hash(data)
+            # повторный Save без изменений не трогает диск
+            if h != self._last_cfg_hash:
+                tmp_path = CONFIG_PATH.with_name(CONFIG_PATH.name + ".tmp")
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    f.write(data)
+                os.replace(tmp_path, CONFIG_PATH)
+                self._last_cfg_hash = h
             self.configChanged.emit()
             QMessageBox.information(self, tr("save_button"), tr("config_saved"))
         except Exception as e:
@@ -948,6 +959,12 @@ class GamepadTrayApp(QApplication):
         self.config_window = ConfigWindow()
         self.config_window.configChanged.connect(self.restart_listener)
 
+        # серия Save/configChanged подряд -> один перезапуск слушателя
+        self._restart_timer = QTimer(self)
+        self._restart_timer.setSingleShot(True)
+        self._restart_timer.timeout.connect(self._do_restart_listener)
+        self._retired_threads = []
+
         self.listener_thread = GamepadListenerThread(self.get_current_config)
         self.listener_thread.actionTriggered.connect(self.on_action_triggered)
         self.listener_thread.statusMessage.connect(self.on_status_message)
@@ -971,13 +988,26 @@ class GamepadTrayApp(QApplication):
         self.config_window.hide()
 
     def restart_listener(self):
-        self.listener_thread.stop()
-        self.listener_thread.wait(2000)
+        self._restart_timer.start(250)
+
+    def _do_restart_listener(self):
+        old = self.listener_thread
+        # держим ссылку, пока поток не завершится; finished подключаем до wait(), чтобы не пропустить сигнал
+        self._retired_threads.append(old)
+        old.finished.connect(lambda t=old: self._forget_thread(t))
+        old.stop()
+        old.wait(500)
+        if old.isFinished():
+            self._forget_thread(old)
         self.listener_thread = GamepadListenerThread(self.get_current_config)
         self.listener_thread.actionTriggered.connect(self.on_action_triggered)
         self.listener_thread.statusMessage.connect(self.on_status_message)
         self.listener_thread.start()
 
+    def _forget_thread(self, thread):
+        if thread in self._retired_threads:
+            self._retired_threads.remove(thread)
+
     def exit_app(self):
         self.listener_thread.stop()
         self.listener_thread.wait(2000)
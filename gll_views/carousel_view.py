@@ -1,6 +1,7 @@
 # gll_views/carousel_view.py
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
 from typing import List, Optional, Tuple
 
@@ -17,13 +18,17 @@ class GameItem:
     tv_badge: str = ""
 
 
+# (pixmap, center-crop source rect, card aspect the rect was computed for)
+PixmapEntry = Tuple[QtGui.QPixmap, QtCore.QRectF, Tuple[int, int]]
+
+
 class LruPixmapCache:
     def __init__(self, capacity: int = 120) -> None:
         self.capacity = max(10, int(capacity))
-        self._map: dict[str, QtGui.QPixmap] = {}
+        self._map: dict[str, PixmapEntry] = {}
         self._order: List[str] = []
 
-    def get(self, key: str) -> Optional[QtGui.QPixmap]:
+    def get(self, key: str) -> Optional[PixmapEntry]:
         pm = self._map.get(key)
         if pm is None:
             return None
@@ -34,7 +39,7 @@ class LruPixmapCache:
         self._order.append(key)
         return pm
 
-    def put(self, key: str, pm: QtGui.QPixmap) -> None:
+    def put(self, key: str, pm: PixmapEntry) -> None:
         if key in self._map:
             self._map[key] = pm
             try:
@@ -49,12 +54,43 @@ class LruPixmapCache:
             old = self._order.pop(0)
             self._map.pop(old, None)
 
+    def discard(self, key: str) -> None:
+        if self._map.pop(key, None) is not None:
+            try:
+                self._order.remove(key)
+            except ValueError:
+                pass
+
+
+class _PosterSignals(QtCore.QObject):
+    loaded = QtCore.pyqtSignal(int, str, QtGui.QImage)  # (generation, path, image)
+
+
+class _PosterLoader(QtCore.QRunnable):
+    """Decodes one poster into a QImage off the GUI thread (QPixmap is made in the slot)."""
+
+    def __init__(self, generation: int, path: str, target: Tuple[int, int], signals: _PosterSignals) -> None:
+        super().__init__()
+        self.generation = generation
+        self.path = path
+        self.target = target
+        self.signals = signals
+
+    def run(self) -> None:
+        reader = QtGui.QImageReader(self.path)
+        size = reader.size()
+        tw, th = self.target
+        if size.isValid() and size.width() > tw and size.height() > th:
+            # decode at scale: enough pixels to cover the card, not the full poster
+            reader.setScaledSize(size.scaled(tw, th, Qt.AspectRatioMode.KeepAspectRatioByExpanding))
+        self.signals.loaded.emit(self.generation, self.path, reader.read())
+
 
 class CarouselView(QtWidgets.QWidget):
     """
     SAFE TV Carousel:
     - без hero background
-    - без фоновых потоков
+    - фоновые потоки только для декодирования постеров в QImage
     - без наклонов
     - snap + анимация + HUD + бейджи
     """
@@ -68,8 +104,11 @@ class CarouselView(QtWidgets.QWidget):
     def __init__(self, parent=None, items: Optional[List[GameItem]] = None, loop: bool = True) -> None:
         super().__init__(parent)
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
-        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
-        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground, True)
+        # background comes from the palette (Qt clears it), paintEvent only draws cards + HUD
+        pal = self.palette()
+        pal.setColor(QtGui.QPalette.ColorRole.Window, QtGui.QColor(10, 10, 12))
+        self.setPalette(pal)
+        self.setAutoFillBackground(True)
 
         self._items: List[GameItem] = items or []
         self._loop = loop
@@ -85,6 +124,9 @@ class CarouselView(QtWidgets.QWidget):
         self._anim = QtCore.QPropertyAnimation(self, b"scrollOffset", self)
         self._anim.setEasingCurve(QtCore.QEasingCurve.Type.OutCubic)
         self._anim.setDuration(170)
+        # one entry per step input; stop() does not emit finished, so interrupted steps queue up
+        self._pending_steps: list[int] = []
+        self._anim.finished.connect(self._on_anim_finished)
 
         self._focus_pulse = 0.0
         self._pulse_anim = QtCore.QPropertyAnimation(self, b"focusPulse", self)
@@ -105,7 +147,33 @@ class CarouselView(QtWidgets.QWidget):
         self._hold_pending = False
 
         self._pix_cache = LruPixmapCache(160)
+        # reduced card aspect (w, h); cached crop rects are only valid for it
+        self._crop_ratio: Tuple[int, int] = (2, 3)
         self._placeholder = self._make_placeholder(600, 900)
+        self._placeholder_src = self._center_crop_source(self._placeholder, *self._crop_ratio)
+
+        # last fully settled frame, see paintEvent
+        self._frame_cache: Optional[QtGui.QPixmap] = None
+        self._frame_key: Optional[Tuple[int, int, int, float]] = None
+
+        # gradients are reused; only endpoints change (QLinearGradient stops are mutable)
+        self._grad_card_darken = QtGui.QLinearGradient()
+        self._grad_card_darken.setColorAt(0.0, QtGui.QColor(0, 0, 0, 0))
+        self._grad_card_darken.setColorAt(1.0, QtGui.QColor(0, 0, 0, 210))
+        self._grad_hud = QtGui.QLinearGradient()
+        self._grad_hud.setColorAt(0.0, QtGui.QColor(0, 0, 0, 0))
+        self._grad_hud.setColorAt(1.0, QtGui.QColor(0, 0, 0, 220))
+        self._update_hud_gradient()
+
+        # poster prefetch after setItems; generation bump drops stale results
+        self._prefetch_gen = 0
+        self._prefetch_pool = QtCore.QThreadPool(self)
+        self._prefetch_signals = _PosterSignals(self)
+        self._prefetch_signals.loaded.connect(self._on_poster_prefetched)
+        # path -> device-pixel card size a prefetched poster was decoded for (full-size loads aren't tracked)
+        self._prefetched_for: dict[str, Tuple[int, int]] = {}
+        # paths with a decode queued/running for the current generation; painted as placeholder until it lands
+        self._prefetch_pending: set[str] = set()
 
         # hints
         self._hint_left = "←/D-Pad"
@@ -114,6 +182,10 @@ class CarouselView(QtWidgets.QWidget):
         self._hint_y = "Y: Профиль"
         self._hint_x = "X: Параметры"
         self._hint_b = "Esc/B: Назад"
+        self._hints_str = "   ".join([
+            self._hint_left, self._hint_a, self._hint_hold,
+            self._hint_y, self._hint_x, self._hint_b,
+        ])
 
     # Qt properties
     def getScrollOffset(self) -> float:
@@ -144,6 +216,9 @@ class CarouselView(QtWidgets.QWidget):
         self._drag_active = False
         self._drag_start_x = 0
         self._drag_accum = 0
+
+        self._restart_prefetch()
+        self._invalidate_frame()
         self.update()
 
     def currentItem(self) -> Optional[GameItem]:
@@ -153,9 +228,28 @@ class CarouselView(QtWidgets.QWidget):
 
     def resizeEvent(self, e: QtGui.QResizeEvent) -> None:
         cw, ch = self._card_size()
+        g = math.gcd(cw, ch)
+        self._crop_ratio = (cw // g, ch // g)
         self._placeholder = self._make_placeholder(cw, ch)
+        self._placeholder_src = self._center_crop_source(self._placeholder, *self._crop_ratio)
+        self._update_hud_gradient()
+        self._drop_undersized_posters()
+        self._invalidate_frame()
         super().resizeEvent(e)
 
+    def changeEvent(self, e: QtCore.QEvent) -> None:
+        # moving to a screen with another scale factor (Qt >= 6.6 reports it explicitly)
+        dpr_change = getattr(QtCore.QEvent.Type, "DevicePixelRatioChange", None)
+        if dpr_change is not None and e.type() == dpr_change:
+            self._drop_undersized_posters()
+            self._invalidate_frame()
+        super().changeEvent(e)
+
+    def _update_hud_gradient(self) -> None:
+        h = self.height()
+        self._grad_hud.setStart(0, h - int(h * 0.26))
+        self._grad_hud.setFinalStop(0, h - 1)
+
     # Painting
     def paintEvent(self, e: QtGui.QPaintEvent) -> None:
         w = self.width()
@@ -164,13 +258,41 @@ class CarouselView(QtWidgets.QWidget):
             return
 
         p = QtGui.QPainter(self)
+        if not self._is_idle():
+            self._render_frame(p, w, h)
+            return
+
+        # parked on one card: identical frames -> blit the last one
+        key = (self._current_index, w, h, round(self._focus_pulse, 3))
+        if self._frame_cache is None or self._frame_key != key:
+            dpr = self.devicePixelRatioF()
+            frame = QtGui.QPixmap(int(w * dpr), int(h * dpr))
+            frame.setDevicePixelRatio(dpr)
+            frame.fill(self.palette().color(QtGui.QPalette.ColorRole.Window))
+            fp = QtGui.QPainter(frame)
+            self._render_frame(fp, w, h)
+            fp.end()
+            self._frame_cache = frame
+            self._frame_key = key
+        p.drawPixmap(0, 0, self._frame_cache)
+
+    def _is_idle(self) -> bool:
+        return (
+            self._scroll_offset == 0.0
+            and not self._drag_active
+            and self._anim.state() != QtCore.QAbstractAnimation.State.Running
+            and self._pulse_anim.state() != QtCore.QAbstractAnimation.State.Running
+        )
+
+    def _invalidate_frame(self) -> None:
+        self._frame_cache = None
+
+    def _render_frame(self, p: QtGui.QPainter, w: int, h: int) -> None:
         p.setRenderHints(
             QtGui.QPainter.RenderHint.Antialiasing
             | QtGui.QPainter.RenderHint.SmoothPixmapTransform
         )
 
-        p.fillRect(self.rect(), QtGui.QColor(10, 10, 12))
-
         if not self._items:
             self._paint_empty(p)
             return
@@ -202,9 +324,9 @@ class CarouselView(QtWidgets.QWidget):
             scale = base_scale * pop
 
             it = self._items[idx]
-            pm = self._load_pixmap(it.poster_path)
+            pm, src = self._load_pixmap(it.poster_path)
 
-            self._paint_card(p, pm, it, x, y, card_w, card_h, scale, alpha, is_current)
+            self._paint_card(p, pm, src, it, x, y, card_w, card_h, scale, alpha, is_current)
 
         self._paint_hud(p)
 
@@ -220,6 +342,7 @@ class CarouselView(QtWidgets.QWidget):
         self,
         p: QtGui.QPainter,
         pm: QtGui.QPixmap,
+        src: QtCore.QRectF,
         item: GameItem,
         x: float,
         y: float,
@@ -239,11 +362,11 @@ class CarouselView(QtWidgets.QWidget):
             shadow = QtGui.QColor(0, 0, 0, 175)
             p.save()
             p.setPen(Qt.PenStyle.NoPen)
+            p.setBrush(shadow)
+            p.setOpacity(0.055)
+            base = rect.adjusted(-6, -6, 6, 6)
             for i in range(8):
-                r = rect.adjusted(-6 - i, -6 - i, 6 + i, 6 + i)
-                p.setOpacity(0.055)
-                p.setBrush(shadow)
-                p.drawRoundedRect(r, radius, radius)
+                p.drawRoundedRect(base.adjusted(-i, -i, i, i), radius, radius)
             p.restore()
 
         p.save()
@@ -253,15 +376,14 @@ class CarouselView(QtWidgets.QWidget):
         p.setClipPath(clip)
 
         if not pm.isNull():
-            src = self._center_crop_source(pm, rect.width(), rect.height())
             p.drawPixmap(rect, pm, src)
         else:
             p.fillRect(rect, QtGui.QColor(35, 35, 40))
 
         grad_h = rect.height() * 0.34
-        grad = QtGui.QLinearGradient(rect.left(), rect.bottom() - grad_h, rect.left(), rect.bottom())
-        grad.setColorAt(0.0, QtGui.QColor(0, 0, 0, 0))
-        grad.setColorAt(1.0, QtGui.QColor(0, 0, 0, 210))
+        grad = self._grad_card_darken
+        grad.setStart(rect.left(), rect.bottom() - grad_h)
+        grad.setFinalStop(rect.left(), rect.bottom())
         p.fillRect(QtCore.QRectF(rect.left(), rect.bottom() - grad_h, rect.width(), grad_h), grad)
 
         p.restore()
@@ -330,10 +452,7 @@ class CarouselView(QtWidgets.QWidget):
         hud_h = int(h * 0.26)
         hud_rect = QtCore.QRect(0, h - hud_h, w, hud_h)
 
-        grad = QtGui.QLinearGradient(0, hud_rect.top(), 0, hud_rect.bottom())
-        grad.setColorAt(0.0, QtGui.QColor(0, 0, 0, 0))
-        grad.setColorAt(1.0, QtGui.QColor(0, 0, 0, 220))
-        p.fillRect(hud_rect, grad)
+        p.fillRect(hud_rect, self._grad_hud)
 
         left = int(w * 0.06)
         right = int(w * 0.06)
@@ -366,11 +485,10 @@ class CarouselView(QtWidgets.QWidget):
 
         p.setFont(hint_font)
         p.setPen(QtGui.QColor(220, 220, 230))
-        hints = f"{self._hint_left}   {self._hint_a}   {self._hint_hold}   {self._hint_y}   {self._hint_x}   {self._hint_b}"
         p.drawText(
             QtCore.QRect(left, hud_rect.bottom() - int(h * 0.045), w - left - right, int(h * 0.04)),
             Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
-            hints,
+            self._hints_str,
         )
 
     # Input
@@ -501,14 +619,17 @@ class CarouselView(QtWidgets.QWidget):
         if self._anim.state() == QtCore.QAbstractAnimation.State.Running:
             self._anim.stop()
 
+        self._invalidate_frame()
         self._anim.setStartValue(self._scroll_offset)
         self._anim.setEndValue(float(direction))
-        self._anim.finished.connect(
-            lambda: self._commit_step(direction),
-            type=QtCore.Qt.ConnectionType.SingleShotConnection,
-        )
+        self._pending_steps.append(direction)
         self._anim.start()
 
+    def _on_anim_finished(self) -> None:
+        steps, self._pending_steps = self._pending_steps, []
+        for direction in steps:
+            self._commit_step(direction)
+
     def _commit_step(self, direction: int) -> None:
         self._current_index = self._clamp_index(self._current_index + direction)
         self._scroll_offset = 0.0
@@ -524,6 +645,7 @@ class CarouselView(QtWidgets.QWidget):
     def _pulse(self) -> None:
         if self._pulse_anim.state() == QtCore.QAbstractAnimation.State.Running:
             self._pulse_anim.stop()
+        self._invalidate_frame()
         self._pulse_anim.setStartValue(1.0)
         self._pulse_anim.setEndValue(0.0)
         self._pulse_anim.start()
@@ -591,20 +713,92 @@ class CarouselView(QtWidgets.QWidget):
 
         return title, sub, hint
 
-    def _load_pixmap(self, path: Optional[str]) -> QtGui.QPixmap:
+    def _load_pixmap(self, path: Optional[str]) -> Tuple[QtGui.QPixmap, QtCore.QRectF]:
         if not path:
-            return self._placeholder
+            return self._placeholder, self._placeholder_src
 
         cached = self._pix_cache.get(path)
         if cached is not None:
-            return cached
-
-        pm = QtGui.QPixmap(path)
-        if pm.isNull():
-            pm = self._placeholder
+            pm, src, ratio = cached
+            if ratio == self._crop_ratio:
+                return pm, src
+        elif path in self._prefetch_pending:
+            # decoding off-thread; _on_poster_prefetched repaints when it lands
+            return self._placeholder, self._placeholder_src
+        else:
+            pm = QtGui.QPixmap(path)
+            if pm.isNull():
+                pm = self._placeholder
+            self._prefetched_for.pop(path, None)  # full resolution: never undersized
+
+        # crop rect depends only on (sw, sh, card aspect) -> compute once per poster
+        src = self._center_crop_source(pm, *self._crop_ratio)
+        self._pix_cache.put(path, (pm, src, self._crop_ratio))
+        return pm, src
+
+    def _poster_target(self) -> Tuple[int, int]:
+        """Card size in device pixels: what a prefetched poster must cover to stay sharp."""
+        cw, ch = self._card_size()
+        dpr = self.devicePixelRatioF()
+        return math.ceil(cw * dpr), math.ceil(ch * dpr)
 
-        self._pix_cache.put(path, pm)
-        return pm
+    def _drop_undersized_posters(self) -> None:
+        tw, th = self._poster_target()
+        stale = [p for p, (w, h) in self._prefetched_for.items() if w < tw or h < th]
+        if not stale:
+            return
+        for path in stale:
+            self._prefetched_for.pop(path, None)
+            self._pix_cache.discard(path)
+        # re-decode the visible neighbourhood for the new card size
+        self._restart_prefetch()
+
+    def _restart_prefetch(self) -> None:
+        # queued synchronously so the next paint already sees these paths as pending
+        self._prefetch_gen += 1
+        self._prefetch_pool.clear()
+        self._prefetch_pending.clear()
+        self._prefetch_initial()
+
+    def _prefetch_initial(self, count: int = 12) -> None:
+        gen = self._prefetch_gen
+        target = self._poster_target()
+        seen: set[str] = set()
+        # current card first, then alternating neighbours: 0, +1, -1, +2, -2, ...
+        rels = [0]
+        for d in range(1, len(self._items)):
+            rels += [d, -d]
+        for rel in rels:
+            if len(seen) >= count:
+                break
+            idx = self._index_at_relative(rel)
+            if idx is None:
+                continue
+            path = self._items[idx].poster_path
+            if not path or path in seen:
+                continue
+            seen.add(path)
+            if self._pix_cache.get(path) is None:
+                self._prefetch_pool.start(_PosterLoader(gen, path, target, self._prefetch_signals))
+                self._prefetched_for[path] = target
+                self._prefetch_pending.add(path)
+
+    def _on_poster_prefetched(self, generation: int, path: str, img: QtGui.QImage) -> None:
+        if generation != self._prefetch_gen:
+            return
+        self._prefetch_pending.discard(path)
+        if img.isNull():
+            # unreadable at scale: let the next paint try the synchronous path
+            self._invalidate_frame()
+            self.update()
+            return
+        if self._pix_cache.get(path) is not None:
+            return
+        pm = QtGui.QPixmap.fromImage(img)
+        src = self._center_crop_source(pm, *self._crop_ratio)
+        self._pix_cache.put(path, (pm, src, self._crop_ratio))
+        self._invalidate_frame()
+        self.update()
 
     def _make_placeholder(self, w: int, h: int) -> QtGui.QPixmap:
         w = max(100, int(w))
@@ -628,20 +822,18 @@ class CarouselView(QtWidgets.QWidget):
         p.end()
         return pm
 
-    def _center_crop_source(self, pm: QtGui.QPixmap, target_w: float, target_h: float) -> QtCore.QRectF:
+    def _center_crop_source(self, pm: QtGui.QPixmap, target_w: int, target_h: int) -> QtCore.QRectF:
         sw, sh = pm.width(), pm.height()
-        if sw <= 0 or sh <= 0:
+        if sw <= 0 or sh <= 0 or target_w <= 0 or target_h <= 0:
             return QtCore.QRectF(0, 0, 0, 0)
 
-        target_ratio = float(target_w) / float(target_h)
-        src_ratio = float(sw) / float(sh)
-
-        if src_ratio > target_ratio:
-            new_w = int(sh * target_ratio)
+        # integer cross-multiplication: sw/sh > tw/th  <=>  sw*th > sh*tw
+        if sw * target_h > sh * target_w:
+            new_w = sh * target_w // target_h
             x0 = (sw - new_w) // 2
             return QtCore.QRectF(x0, 0, new_w, sh)
         else:
-            new_h = int(sw / target_ratio)
+            new_h = sw * target_h // target_w
             y0 = (sh - new_h) // 2
             return QtCore.QRectF(0, y0, sw, new_h)
 
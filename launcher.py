@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import json
 import os
+from collections import deque
 from typing import Dict, Any, Optional
 
 from PyQt6 import QtCore, QtGui, QtWidgets
@@ -10,6 +11,19 @@ from PyQt6.QtCore import Qt
 from core.profile_manager import LastProfileStore, compute_game_id, game_to_profiles
 from core.launch_pipeline import LaunchPipeline
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None  # type: ignore
+
+# keep a pre-parsed games.msgpack next to games.json (needs msgpack)
+USE_GAMES_BINARY_CACHE = True
+
 
 # --- Optional imports (не ломаем запуск если файлов нет)
 try:
@@ -32,30 +46,64 @@ except Exception:
 def load_json(path: str, default):
     try:
         if os.path.exists(path):
-            with open(path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            with open(path, "rb") as f:
+                raw = f.read()
+            return orjson.loads(raw) if orjson is not None else json.loads(raw)
     except Exception:
         pass
     return default
 
 
-def save_json(path: str, data) -> None:
+def dump_json(data) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def file_signature(path: str) -> Optional[tuple]:
+    """(mtime_ns, size) of a file, or None if it can't be stat'ed."""
     try:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-    except Exception:
-        pass
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
 
+def _load_games_data(path: str, binary_cache: bool):
+    if not binary_cache or msgpack is None:
+        return load_json(path, {})
+
+    sidecar = os.path.splitext(path)[0] + ".msgpack"
+    # the sidecar records the (mtime_ns, size) of the games.json it was built from;
+    # an mtime comparison alone would trust it after restoring an older games.json
+    sig = file_signature(path)
+    try:
+        with open(sidecar, "rb") as f:
+            cached = msgpack.unpackb(f.read(), raw=False)
+        if sig is not None and isinstance(cached, dict) and tuple(cached.get("src") or ()) == sig:
+            return cached["data"]
+    except Exception:
+        pass  # missing/stale/corrupt sidecar -> parse JSON and rewrite it
 
-def load_games(path: str) -> Dict[str, dict]:
     data = load_json(path, {})
+    if sig is not None:
+        try:
+            with open(sidecar, "wb") as f:
+                f.write(msgpack.packb({"src": list(sig), "data": data}, use_bin_type=True))
+        except Exception:
+            pass
+    return data
+
+
+def load_games(path: str, binary_cache: bool = USE_GAMES_BINARY_CACHE) -> Dict[str, dict]:
+    data = _load_games_data(path, binary_cache)
     if isinstance(data, dict):
+        # dicts come straight from the parser and are not shared -> no per-game copy
         out = {}
         for k, v in data.items():
             if isinstance(v, dict):
-                g = dict(v)
-                g.setdefault("name", v.get("name", k))
-                out[g["name"]] = g
+                v.setdefault("name", k)
+                out[v["name"]] = v
         return out
     out = {}
     if isinstance(data, list):
@@ -65,9 +113,39 @@ def load_games(path: str) -> Dict[str, dict]:
     return out
 
 
+def _profile_keys_by_monitor(game: dict) -> Dict[str, str]:
+    """{monitor_id: profile_key} for a game; the first profile wins on duplicates."""
+    out: Dict[str, str] = {}
+    mp = game.get("monitor_profiles") or {}
+    if isinstance(mp, dict):
+        for k, p in mp.items():
+            out.setdefault(str((p or {}).get("monitor_id", "")), k)
+    return out
+
+
+class GamesListModel(QtCore.QAbstractListModel):
+    """Flat list of game names for the List page (reset as a whole on refresh)."""
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self.names: list[str] = []
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.names)
+
+    def data(self, index: QtCore.QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and index.isValid():
+            return self.names[index.row()]
+        return None
 
-class _WaitProcessWorker(QtCore.QObject):
-    finished = QtCore.pyqtSignal()
+    def set_names(self, names: list[str]) -> None:
+        self.beginResetModel()
+        self.names = names
+        self.endResetModel()
+
+
+class _WaitProcessWorker(QtCore.QRunnable):
+    """Blocks on a launched game's process, then restores its config session."""
 
     def __init__(self, proc, session, pipeline) -> None:
         super().__init__()
@@ -83,7 +161,6 @@ class _WaitProcessWorker(QtCore.QObject):
                 self.pipeline.restore(self.session)
             except Exception:
                 pass
-            self.finished.emit()
 
 
 class GameLauncher(QtWidgets.QMainWindow):
@@ -100,9 +177,21 @@ class GameLauncher(QtWidgets.QMainWindow):
 
         self.last_profiles = LastProfileStore(self.last_profiles_path)
         self.pipeline = LaunchPipeline(self.backups_root)
+        # own pool: process waits last as long as the game, keep them off the global (poster) pool
+        self._wait_pool = QtCore.QThreadPool(self)
 
+        self._games_sig = file_signature(self.games_path)
+        self._gid_cache: Dict[tuple, str] = {}
         self.games: Dict[str, dict] = load_games(self.games_path)
+        # hash of what games.json holds, so even the first no-op save is skipped
+        self._games_saved_hash: Optional[int] = self._games_dump_hash()
+        # display order shared by list/grid/carousel; rebuilt only when self.games changes
+        self._sorted_names: list[str] = []
+        self._profile_by_monitor: Dict[str, Dict[str, str]] = {}  # gid -> {monitor_id: profile_key}
+        self._games_changed()
+        self._monitors_sig = file_signature(self.monitors_path)
         self.monitors: dict = load_json(self.monitors_path, {})
+        self._index_monitors()
 
         root = QtWidgets.QWidget()
         root.setObjectName("Root")
@@ -116,6 +205,9 @@ class GameLauncher(QtWidgets.QMainWindow):
         self.carousel_view = None
         self.editor = None
 
+        # pages are rendered lazily: refresh marks them dirty, only the visible one is drawn
+        self._dirty = {"grid": False, "list": False, "carousel": False}
+
         self._build_topbar()
 
         self.content = QtWidgets.QWidget()
@@ -144,9 +236,28 @@ class GameLauncher(QtWidgets.QMainWindow):
         self.grid_scroll.setWidget(self.grid_container)
         self.stack.addWidget(self.grid_scroll)
 
+        # GameTile instances are recycled across render_grid calls
+        self._tile_w, self._tile_h = 240, 360
+        self._tile_pool: list = []
+        self._tile_by_name: Dict[str, Any] = {}
+        self._tiles: list = []  # tiles currently in the grid, in display order
+        self._grid_cols = 0
+        # incremental populate: names still to place, bumped generation cancels a run
+        self._grid_batch = 16
+        self._pending_names: deque = deque()
+        self._reuse_by_name: Dict[str, Any] = {}
+        self._free_tiles: list = []
+        self._populate_gen = 0
+        # tiles whose monitor labels predate the last monitors.json change; rebound even if the game is unchanged
+        self._stale_tiles: set = set()
+
         # ---------- LIST PAGE ----------
-        self.list_widget = QtWidgets.QListWidget()
-        self.list_widget.itemActivated.connect(self._on_list_activated)
+        self._games_model = GamesListModel(self)
+        self.list_widget = QtWidgets.QListView()
+        self.list_widget.setModel(self._games_model)
+        self.list_widget.setUniformItemSizes(True)
+        self.list_widget.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.list_widget.activated.connect(self._on_list_activated)
         self.list_widget.setObjectName("GameList")
         self.stack.addWidget(self.list_widget)
 
@@ -176,7 +287,13 @@ class GameLauncher(QtWidgets.QMainWindow):
         # reflow on resize
         self._grid_reflow_timer = QtCore.QTimer(self)
         self._grid_reflow_timer.setSingleShot(True)
-        self._grid_reflow_timer.timeout.connect(self.render_grid)
+        self._grid_reflow_timer.timeout.connect(self._on_grid_resized)
+
+        # back-to-back refresh() calls within one event-loop tick collapse into one
+        self._refresh_timer = QtCore.QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self._do_refresh)
 
         self.refresh()
 
@@ -251,82 +368,236 @@ class GameLauncher(QtWidgets.QMainWindow):
         else:
             self.stack.setCurrentWidget(self.grid_scroll)
             self.btn_grid.setChecked(True)
+        self._render_current()
+
+    def _render_current(self) -> None:
+        w = self.stack.currentWidget()
+        if w is self.grid_scroll:
+            page = "grid"
+        elif w is self.list_widget:
+            page = "list"
+        elif self.carousel_view is not None and w is self.carousel_view:
+            page = "carousel"
+        else:
+            return
+        if not self._dirty[page]:
+            return
+        if page == "grid" and not self.isVisible():
+            return  # no final viewport width yet; showEvent renders it once
+        self._dirty[page] = False
+        if page == "grid":
+            self.render_grid()
+        elif page == "list":
+            self.render_list()
+        else:
+            self._do_refresh_carousel()
 
     # ---------------- Data actions ----------------
     def reload(self) -> None:
-        self.games = load_games(self.games_path)
+        # re-parse only files that changed on disk since the last load/save
+        sig = file_signature(self.games_path)
+        if sig is None or sig != self._games_sig:
+            self._games_sig = sig
+            self.games = load_games(self.games_path)
+            self._games_saved_hash = self._games_dump_hash()
+            self._games_changed()
+        sig = file_signature(self.monitors_path)
+        if sig is None or sig != self._monitors_sig:
+            self._monitors_sig = sig
+            self.monitors = load_json(self.monitors_path, {})
+            self._index_monitors()
+            self._stale_tiles = set(self._tile_pool)
+            if self.editor is not None:
+                self.editor.monitors = self.monitors
         self.refresh()
 
+    def _games_changed(self) -> None:
+        # derived views of self.games; call after every load/mutation
+        self._sorted_names = sorted(self.games, key=str.lower)
+        self._profile_by_monitor = {self._cached_gid(g): _profile_keys_by_monitor(g) for g in self.games.values()}
+
+    def _cached_gid(self, game: dict) -> str:
+        # keyed by the fields compute_game_id reads, so edits can't return a stale id
+        key = (game.get("id"), game.get("name"), game.get("exe_path"))
+        gid = self._gid_cache.get(key)
+        if gid is None:
+            gid = compute_game_id(game)
+            self._gid_cache[key] = gid
+        return gid
+
+    def _games_dump_hash(self) -> Optional[int]:
+        try:
+            return hash(dump_json(self.games))
+        except Exception:
+            return None
+
+    def _save_games(self) -> None:
+        try:
+            raw = dump_json(self.games)
+        except Exception:
+            return
+        h = hash(raw)
+        if h == self._games_saved_hash and file_signature(self.games_path) == self._games_sig:
+            return  # editor saved without changes
+        try:
+            with open(self.games_path, "wb") as f:
+                f.write(raw)
+        except Exception:
+            return
+        self._games_saved_hash = h
+        self._games_sig = file_signature(self.games_path)
+
     def refresh(self) -> None:
-        self.render_list()
-        self.render_grid()
-        self._refresh_carousel()
+        self._refresh_timer.start()
+
+    def _do_refresh(self) -> None:
+        self._dirty.update(grid=True, list=True, carousel=True)
+        self._render_current()
 
     # ---------------- Render list ----------------
     def render_list(self) -> None:
-        self.list_widget.clear()
-        for name in sorted(self.games.keys(), key=lambda x: x.lower()):
-            self.list_widget.addItem(name)
+        self._games_model.set_names(self._sorted_names)
 
     # ---------------- Render grid ----------------
     def render_grid(self) -> None:
-        # clear
+        self._rebuild_tiles(self._sorted_names)
+
+    def _grid_columns(self) -> int:
+        viewport_w = self.grid_scroll.viewport().width()
+        spacing = self.grid_layout.horizontalSpacing()
+        return max(2, min(7, int((max(400, viewport_w) + spacing) / (self._tile_w + spacing))))
+
+    def _clear_grid_layout(self) -> None:
+        # pooled tiles survive, everything else (e.g. the empty-state label) is dropped
+        pooled = set(self._tile_pool)
         while self.grid_layout.count():
             it = self.grid_layout.takeAt(0)
             w = it.widget()
-            if w:
+            if w and w not in pooled:
                 w.deleteLater()
+        for r in range(self.grid_layout.rowCount()):
+            self.grid_layout.setRowStretch(r, 0)
+
+    def _rebuild_tiles(self, names: list[str]) -> None:
+        # cancels any population still in progress
+        self._populate_gen += 1
+        self._clear_grid_layout()
+
+        prev = dict(self._reuse_by_name)
+        prev.update(self._tile_by_name)
+        for tile in self._tile_pool:
+            tile.hide()
+        self._tiles = []
+        self._tile_by_name = {}
+        self._pending_names.clear()
 
-        names = sorted(self.games.keys(), key=lambda x: x.lower())
         if not names or GameTile is None:
+            self._reuse_by_name = {}
             lbl = QtWidgets.QLabel("Нет игр (или не найден game_tile.py).")
             lbl.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
             self.grid_layout.addWidget(lbl, 0, 0)
             return
 
-        viewport_w = self.grid_scroll.viewport().width()
-        tile_w, tile_h = 240, 360
-        spacing = self.grid_layout.horizontalSpacing()
-
-        cols = max(2, min(7, int((max(400, viewport_w) + spacing) / (tile_w + spacing))))
-
-        row = col = 0
-        for name in names:
-            g = self.games[name]
-            tile = GameTile(g, width=tile_w, height=tile_h, get_monitor_name=self.get_monitor_name)
-            tile.clicked.connect(self._on_tile_launch)
-            tile.edit_clicked.connect(self._on_tile_edit)
-            tile.delete_clicked.connect(self._on_tile_delete)
-            self.grid_layout.addWidget(tile, row, col)
+        # keep the tile that already shows a game; rebind free tiles to the rest
+        wanted = set(names)
+        self._reuse_by_name = {n: t for n, t in prev.items() if n in wanted}
+        reused = set(self._reuse_by_name.values())
+        self._free_tiles = [t for t in self._tile_pool if t not in reused]
 
-            col += 1
-            if col >= cols:
-                col = 0
-                row += 1
+        self._grid_cols = self._grid_columns()
+        self._pending_names.extend(names)
+        # first batch right away so the page is never blank, the rest on later event-loop ticks
+        self._flush_batch(self._populate_gen)
 
-        self.grid_layout.setRowStretch(row + 1, 1)
+    def _flush_batch(self, gen: int) -> None:
+        if gen != self._populate_gen:
+            return
+        cols = self._grid_cols
+        for _ in range(min(self._grid_batch, len(self._pending_names))):
+            name = self._pending_names.popleft()
+            g = self.games.get(name)
+            if g is None:
+                continue
+            tile = self._reuse_by_name.pop(name, None)
+            if tile is None and self._free_tiles:
+                tile = self._free_tiles.pop()
+            if tile is None:
+                tile = GameTile(g, width=self._tile_w, height=self._tile_h, get_monitor_name=self.get_monitor_name)
+                tile.clicked.connect(self._on_tile_launch)
+                tile.edit_clicked.connect(self._on_tile_edit)
+                tile.delete_clicked.connect(self._on_tile_delete)
+                self._tile_pool.append(tile)
+            elif tile.game_data is not g or tile in self._stale_tiles:
+                tile.set_game(g)
+            self._stale_tiles.discard(tile)
+            i = len(self._tiles)
+            self._tiles.append(tile)
+            self._tile_by_name[name] = tile
+            self.grid_layout.addWidget(tile, i // cols, i % cols)
+            tile.show()
+
+        if self._pending_names:
+            QtCore.QTimer.singleShot(0, lambda: self._flush_batch(gen))
+            return
+        self._set_grid_tail_stretch()
+
+    def _set_grid_tail_stretch(self) -> None:
+        for r in range(self.grid_layout.rowCount()):
+            self.grid_layout.setRowStretch(r, 0)
+        cols = max(1, self._grid_cols)
+        self.grid_layout.setRowStretch((len(self._tiles) + cols - 1) // cols, 1)
+
+    def _reflow_tiles(self, cols: int) -> None:
+        """Place existing tiles into a grid with `cols` columns (no construction)."""
+        self._clear_grid_layout()
+        for i, tile in enumerate(self._tiles):
+            self.grid_layout.addWidget(tile, i // cols, i % cols)
+        self._grid_cols = cols
+        self._set_grid_tail_stretch()
+
+    def _on_grid_resized(self) -> None:
+        if not self._tiles:
+            return
+        cols = self._grid_columns()
+        if cols != self._grid_cols:
+            self._reflow_tiles(cols)
 
     
 
-    def _refresh_carousel(self) -> None:
+    def _do_refresh_carousel(self) -> None:
         if self.carousel_view is None or GameItem is None:
             return
         items = []
-        for name in sorted(self.games.keys(), key=lambda x: x.lower()):
+        for name in self._sorted_names:
             g = self.games[name]
-            gid = compute_game_id(g)
+            gid = self._cached_gid(g)
             last_mid = self.last_profiles.get(gid) or ""
-            prof_name = self.get_monitor_name(last_mid) if last_mid else ""
+            prof_name = tv_badge = ""
+            if last_mid:
+                prof_name = self.get_monitor_name(last_mid)
+                tv_badge = self._tv_badge_by_id.get(last_mid)
+                if tv_badge is None:
+                    tv_badge = "TV" if "tv" in prof_name.lower() else ""
             items.append(GameItem(
                 id=name,
                 title=str(g.get("name", name)),
                 poster_path=g.get("poster_path"),
                 profile_name=prof_name,
-                tv_badge="TV" if "tv" in (prof_name or "").lower() else ""
+                tv_badge=tv_badge
             ))
         self.carousel_view.setItems(items)
+
+    def _index_monitors(self) -> None:
+        # str ids -> display names / TV badge, rebuilt whenever self.monitors is replaced
+        self._monitor_name_by_id: Dict[str, str] = {str(k): str(v) for k, v in self.monitors.items()}
+        self._tv_badge_by_id: Dict[str, str] = {
+            k: ("TV" if "tv" in v.lower() else "") for k, v in self._monitor_name_by_id.items()
+        }
+
     def get_monitor_name(self, monitor_id: Any) -> str:
-        return str(self.monitors.get(str(monitor_id), f"monitor_{monitor_id}"))
+        mid = monitor_id if isinstance(monitor_id, str) else str(monitor_id)
+        name = self._monitor_name_by_id.get(mid)
+        return name if name is not None else f"monitor_{mid}"
 
     # ---------------- Add game (optional) ----------------
     def add_game(self) -> None:
@@ -357,15 +628,17 @@ class GameLauncher(QtWidgets.QMainWindow):
             prof = mp[profile_key]
         else:
             # fallback to last monitor id (stored), else first profile
-            gid = compute_game_id(game)
+            gid = self._cached_gid(game)
             last_mid = self.last_profiles.get(gid)
             prof = None
             if last_mid is not None:
-                for _k, _p in mp.items():
-                    if str((_p or {}).get("monitor_id", "")) == str(last_mid):
-                        prof = _p
-                        profile_key = _k
-                        break
+                by_mid = self._profile_by_monitor.get(gid)
+                if by_mid is None:
+                    by_mid = _profile_keys_by_monitor(game)
+                k = by_mid.get(last_mid)
+                if k is not None and k in mp:
+                    prof = mp[k]
+                    profile_key = k
             if prof is None and isinstance(mp, dict) and mp:
                 profile_key, prof = next(iter(mp.items()))
 
@@ -374,7 +647,7 @@ class GameLauncher(QtWidgets.QMainWindow):
             return
 
         # remember last
-        gid = compute_game_id(game)
+        gid = self._cached_gid(game)
         self.last_profiles.set(gid, str(prof.get("monitor_id", "0")))
 
         # build DisplayProfile and launch
@@ -402,15 +675,8 @@ class GameLauncher(QtWidgets.QMainWindow):
             QtWidgets.QMessageBox.critical(self, "Launch error", str(e))
             return
 
-        # wait in background thread so UI doesn't freeze
-        th = QtCore.QThread(self)
-        worker = _WaitProcessWorker(proc, session, self.pipeline)
-        worker.moveToThread(th)
-        th.started.connect(worker.run)
-        worker.finished.connect(th.quit)
-        worker.finished.connect(worker.deleteLater)
-        th.finished.connect(th.deleteLater)
-        th.start()
+        # wait on a pooled thread so UI doesn't freeze
+        self._wait_pool.start(_WaitProcessWorker(proc, session, self.pipeline))
 
     def _on_tile_edit(self, game: dict) -> None:
         if self.editor is None:
@@ -430,11 +696,12 @@ class GameLauncher(QtWidgets.QMainWindow):
         if QtWidgets.QMessageBox.question(self, "Delete game", f"Delete '{name}'?") != QtWidgets.QMessageBox.StandardButton.Yes:
             return
         self.games.pop(name, None)
-        save_json(self.games_path, self.games)
+        self._games_changed()
+        self._save_games()
         self.refresh()
 
-    def _on_list_activated(self, item: QtWidgets.QListWidgetItem) -> None:
-        name = item.text()
+    def _on_list_activated(self, index: QtCore.QModelIndex) -> None:
+        name = index.data()
         g = self.games.get(name)
         if g:
             self._on_tile_launch((g, None))
@@ -446,7 +713,8 @@ class GameLauncher(QtWidgets.QMainWindow):
             QtWidgets.QMessageBox.warning(self, "Save", "Game name is empty.")
             return
         self.games[name] = game
-        save_json(self.games_path, self.games)
+        self._games_changed()
+        self._save_games()
         self.refresh()
         self.set_view("grid")
 
@@ -495,6 +763,10 @@ class GameLauncher(QtWidgets.QMainWindow):
             return
         super().keyPressEvent(e)
 
+    def showEvent(self, event: QtGui.QShowEvent) -> None:
+        super().showEvent(event)
+        self._render_current()
+
     def resizeEvent(self, event: QtGui.QResizeEvent) -> None:
         super().resizeEvent(event)
         if self.stack.currentWidget() == self.grid_scroll:
@@ -1,6 +1,6 @@
 import os
 import sys
-from PyQt6 import QtWidgets
+from PyQt6 import QtGui, QtWidgets
 
 # если на ТВ/DPI бывают краши, пусть будет безопасный режим
 os.environ.setdefault("QT_OPENGL", "software")
@@ -11,6 +11,8 @@ from launcher import GameLauncher  # noqa: E402
 def main() -> int:
     app = QtWidgets.QApplication(sys.argv)
     app.setApplicationName("GLL")
+    # decoded tile posters are shared through QPixmapCache (limit in KB, LRU eviction)
+    QtGui.QPixmapCache.setCacheLimit(131072)
 
     qss_path = os.path.join(os.path.dirname(__file__), "style.qss")
     if os.path.exists(qss_path):
@@ -9,9 +9,44 @@ try:
 except ImportError:
     WIN32_AVAILABLE = False
 
+# EnumDisplayMonitors result, reused while the Qt screen layout is unchanged
+_cached_rects = None
+_cached_sig = None
+_screen_signals_hooked = False
+
+def _invalidate_rects(*_args):
+    global _cached_rects, _cached_sig
+    _cached_rects = None
+    _cached_sig = None
+
+def _hook_screen_signals():
+    global _screen_signals_hooked
+    app = QGuiApplication.instance()
+    if _screen_signals_hooked or app is None:
+        return
+    app.screenAdded.connect(_invalidate_rects)
+    app.screenRemoved.connect(_invalidate_rects)
+    app.primaryScreenChanged.connect(_invalidate_rects)
+    _screen_signals_hooked = True
+
+def _screens_signature():
+    return tuple((s.geometry().getRect(), s.name()) for s in QGuiApplication.screens())
+
 def get_physical_monitors_rects():
+    global _cached_rects, _cached_sig
     if not WIN32_AVAILABLE:
         return []
+    _hook_screen_signals()
+    sig = _screens_signature()
+    if _cached_rects is not None and sig == _cached_sig:
+        return list(_cached_rects)
+    rects = _enum_physical_monitors_rects()
+    if rects:
+        _cached_rects = rects
+        _cached_sig = sig
+    return list(rects)
+
+def _enum_physical_monitors_rects():
     from ctypes import windll, byref, c_int
 
     class RECT(ctypes.Structure):
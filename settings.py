@@ -1,8 +1,28 @@
 import os
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 
+
+def _read_json(path):
+    with open(path, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _write_json(path, data):
+    if orjson is not None:
+        raw = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        raw = json.dumps(data, indent=4).encode('utf-8')
+    with open(path, 'wb') as f:
+        f.write(raw)
+
 class Settings:
     def __init__(self):
         self.grid = self._load_grid()
@@ -12,16 +32,14 @@ class Settings:
     def _load_grid(self):
         path = os.path.join(SCRIPT_DIR, "settings_grid.json")
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return _read_json(path)
         except:
             return {"columns": 4, "tile_width": 200, "tile_height": 300, "spacing": 10}
 
     def _load_carousel(self):
         path = os.path.join(SCRIPT_DIR, "settings_carousel.json")
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return _read_json(path)
         except:
             return {
                 "tile_width": 200,
@@ -35,25 +53,21 @@ class Settings:
     def _load_list(self):
         path = os.path.join(SCRIPT_DIR, "settings_list.json")
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return _read_json(path)
         except:
             return {"spacing": 5}
 
     def save_grid(self, settings):
         path = os.path.join(SCRIPT_DIR, "settings_grid.json")
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(settings, f, indent=4)
+        _write_json(path, settings)
         self.grid = settings
 
     def save_carousel(self, settings):
         path = os.path.join(SCRIPT_DIR, "settings_carousel.json")
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(settings, f, indent=4)
+        _write_json(path, settings)
         self.carousel = settings
 
     def save_list(self, settings):
         path = os.path.join(SCRIPT_DIR, "settings_list.json")
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(settings, f, indent=4)
+        _write_json(path, settings)
         self.list_view = settings
\ No newline at end of file
@@ -3,6 +3,12 @@ import os
 import json
 import warnings
 from pathlib import Path
+from types import MappingProxyType
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 SCRIPT_DIR = Path(__file__).parent
 LOCALES_DIR = SCRIPT_DIR / "locales"
@@ -24,20 +30,25 @@ def load_translations():
 
     translations = {}
     lang_file = LOCALES_DIR / f"{system_lang}.json"
+    if not lang_file.exists():
+        lang_file = LOCALES_DIR / "en.json"
     if lang_file.exists():
-        with open(lang_file, 'r', encoding='utf-8') as f:
-            translations = json.load(f)
-    else:
-        fallback = LOCALES_DIR / "en.json"
-        if fallback.exists():
-            with open(fallback, 'r', encoding='utf-8') as f:
-                translations = json.load(f)
+        raw = lang_file.read_bytes()
+        translations = orjson.loads(raw) if orjson is not None else json.loads(raw)
     return translations
 
 translations = load_translations()
 
+# key -> (text, needs_format); strings without braces skip str.format entirely
+_table = MappingProxyType({
+    k: (v, "{" in v or "}" in v) for k, v in translations.items() if isinstance(v, str)
+})
+
 def tr(key, *args):
-    text = translations.get(key, key)
-    if args:
+    entry = _table.get(key)
+    if entry is None:
+        return key.format(*args) if args else key
+    text, needs_format = entry
+    if args and needs_format:
         return text.format(*args)
     return text
\ No newline at end of file
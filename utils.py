@@ -1,9 +1,24 @@
 import os
+import math
 import json
-import hashlib
+import zlib
 import tempfile
 import shutil
-from PIL import Image, ImageDraw, ImageFont
+import functools
+import threading
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+
+# PIL, pywin32 and NumPy are imported on first icon work, not at startup
+# (see _load_pil/_load_win32/_load_numpy)
+Image = ImageDraw = ImageFont = None
+np = None
+_numpy_checked = False
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_FILE = os.path.join(SCRIPT_DIR, "games.json")
@@ -14,37 +29,106 @@ MONITORS_FILE = os.path.join(SCRIPT_DIR, "monitors.json")
 if not os.path.exists(ICONS_DIR):
     os.makedirs(ICONS_DIR)
 
-try:
-    import win32ui
-    import win32gui
-    import win32con
-    import win32api
-    import win32process
-    WIN32_AVAILABLE = True
-    if hasattr(win32api, 'ExtractIconEx'):
-        ExtractIconEx = win32api.ExtractIconEx
-    elif hasattr(win32gui, 'ExtractIconEx'):
-        ExtractIconEx = win32gui.ExtractIconEx
-    else:
-        ExtractIconEx = None
-except ImportError:
-    WIN32_AVAILABLE = False
-    ExtractIconEx = None
+# one directory listing instead of a stat per button icon lookup
+_BUTTON_FILES = {e.name for e in os.scandir(BUTTON_ICONS_DIR)} if os.path.isdir(BUTTON_ICONS_DIR) else set()
+
+WIN32_AVAILABLE = all(importlib.util.find_spec(m) is not None for m in ("win32ui", "win32gui", "win32api"))
+win32ui = win32gui = win32api = None
+ExtractIconEx = None
+
+def _load_pil():
+    global Image, ImageDraw, ImageFont
+    if ImageFont is None:  # assigned last by the import below
+        from PIL import Image, ImageDraw, ImageFont
+
+def _load_win32():
+    """Import pywin32 on first use; returns False if it is missing."""
+    global WIN32_AVAILABLE, win32ui, win32gui, win32api, ExtractIconEx
+    if not WIN32_AVAILABLE:
+        return False
+    if win32api is None:
+        try:
+            import win32ui as _ui
+            import win32gui as _gui
+            import win32api as _api
+        except ImportError:
+            WIN32_AVAILABLE = False
+            return False
+        if hasattr(_api, 'ExtractIconEx'):
+            ExtractIconEx = _api.ExtractIconEx
+        elif hasattr(_gui, 'ExtractIconEx'):
+            ExtractIconEx = _gui.ExtractIconEx
+        win32ui, win32gui = _ui, _gui
+        win32api = _api  # bound last: other threads treat it as "fully loaded"
+    return True
+
+def _load_numpy():
+    """numpy module, or None if it is not installed."""
+    global np, _numpy_checked
+    if not _numpy_checked:
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+        _numpy_checked = True
+    return np
 
 def load_button_icon(filename, size=(24, 24)):
+    return _load_button_icon_cached(filename, tuple(size))
+
+@functools.lru_cache(maxsize=64)
+def _load_button_icon_cached(filename, size):
     from PyQt6.QtGui import QPixmap
     from PyQt6.QtCore import Qt
-    path = os.path.join(BUTTON_ICONS_DIR, filename)
-    if os.path.exists(path):
-        pixmap = QPixmap(path)
+    if filename in _BUTTON_FILES:
+        pixmap = QPixmap(os.path.join(BUTTON_ICONS_DIR, filename))
         return pixmap.scaled(size[0], size[1],
                              Qt.AspectRatioMode.KeepAspectRatio,
                              Qt.TransformationMode.SmoothTransformation)
     return None
 
+# (exe_path, mtime_ns, size, icon size, output_path) -> written icon path
+_icon_cache = {}
+
 def extract_icon_from_exe(exe_path, output_path, size=(128, 128)):
-    if not WIN32_AVAILABLE or ExtractIconEx is None:
+    try:
+        st = os.stat(exe_path)
+    except OSError:
+        return _extract_icon_from_exe(exe_path, output_path, size)
+    key = (exe_path, st.st_mtime_ns, st.st_size, tuple(size), output_path)
+    cached = _icon_cache.get(key)
+    if cached is not None and os.path.exists(cached):
+        return cached
+    try:
+        # icon written after the exe last changed: reuse it across restarts
+        if os.stat(output_path).st_mtime_ns >= st.st_mtime_ns:
+            _icon_cache[key] = output_path
+            return output_path
+    except OSError:
+        pass
+    result = _extract_icon_from_exe(exe_path, output_path, size)
+    _icon_cache[key] = result
+    return result
+
+def extract_icons_batch(pairs, size=(128, 128)):
+    """
+    Extract icons for [(exe_path, output_path), ...] concurrently.
+    Win32 icon calls and PIL resize/encode release the GIL, so a small pool overlaps them.
+    Returns {exe_path: icon_path}.
+    """
+    pairs = list(pairs)
+    if not pairs:
+        return {}
+    _load_pil()
+    _load_win32()
+    with ThreadPoolExecutor(max_workers=min(8, len(pairs))) as executor:
+        return dict(executor.map(lambda p: (p[0], extract_icon_from_exe(p[0], p[1], size)), pairs))
+
+def _extract_icon_from_exe(exe_path, output_path, size):
+    _load_pil()
+    if not _load_win32() or ExtractIconEx is None:
         return create_placeholder_icon(output_path, size, exe_path)
+    large_icons = small_icons = None
     try:
         large_icons, small_icons = ExtractIconEx(exe_path, 0)
         if large_icons and large_icons[0]:
@@ -52,28 +136,18 @@ def extract_icon_from_exe(exe_path, output_path, size=(128, 128)):
             info = win32gui.GetIconInfo(hicon)
             if info and info[4]:
                 hbitmap = info[4]
-                temp_bmp = os.path.join(tempfile.gettempdir(),
-                                        f"temp_icon_{hashlib.md5(exe_path.encode()).hexdigest()}.bmp")
                 bitmap = win32ui.CreateBitmapFromHandle(hbitmap)
-                dc = win32ui.CreateDC()
-                mem_dc = dc.CreateCompatibleDC()
-                mem_dc.SelectObject(bitmap)
-                bitmap.SaveBitmapFile(mem_dc, temp_bmp)
-                try:
-                    mem_dc.DeleteDC()
-                except:
-                    pass
-                try:
-                    dc.DeleteDC()
-                except:
-                    pass
-                if os.path.exists(temp_bmp):
-                    img = Image.open(temp_bmp)
+                img = _bitmap_to_image(bitmap)
+                if img is None:
+                    img = _bitmap_to_image_via_file(bitmap, exe_path)
+                if img is not None:
                     if img.mode != 'RGBA':
                         img = img.convert('RGBA')
-                    img = img.resize(size, Image.Resampling.LANCZOS)
+                    if img.size != size:
+                        # LANCZOS only pays off for heavy downscales; icons are usually 32-256px
+                        heavy = max(img.size) > 2 * max(size)
+                        img = img.resize(size, Image.Resampling.LANCZOS if heavy else Image.Resampling.BILINEAR)
                     img.save(output_path, "PNG")
-                    os.remove(temp_bmp)
                     return output_path
     except Exception:
         pass
@@ -88,45 +162,145 @@ def extract_icon_from_exe(exe_path, output_path, size=(128, 128)):
                             pass
     return create_placeholder_icon(output_path, size, exe_path)
 
+def _bitmap_to_image(bitmap):
+    """Read a 32bpp HBITMAP's pixels straight into PIL, or None if unsupported."""
+    try:
+        bmp_info = bitmap.GetInfo()
+        if bmp_info['bmBitsPixel'] != 32:
+            return None
+        bits = bitmap.GetBitmapBits(True)
+        w, h = bmp_info['bmWidth'], bmp_info['bmHeight']
+        if _load_numpy() is not None:
+            # fancy indexing yields a fresh contiguous RGBA array in one gather
+            arr = np.frombuffer(bits, np.uint8).reshape(h, w, 4)[:, :, [2, 1, 0, 3]]
+            if not arr[:, :, 3].any():
+                arr[:, :, 3] = 255
+            return Image.fromarray(arr, 'RGBA')
+        img = Image.frombuffer('RGBA', (w, h), bits, 'raw', 'BGRA', 0, 1)
+        if img.getextrema()[3][1] == 0:
+            # legacy icons carry no alpha channel; treat them as opaque
+            img.putalpha(255)
+        return img
+    except Exception:
+        return None
+
+def _bitmap_to_image_via_file(bitmap, exe_path):
+    temp_bmp = os.path.join(tempfile.gettempdir(),
+                            f"temp_icon_{zlib.crc32(exe_path.encode()):08x}_{threading.get_ident()}.bmp")
+    # only this fallback needs DCs (SaveBitmapFile); _bitmap_to_image reads the HBITMAP directly
+    dc = win32ui.CreateDC()
+    mem_dc = dc.CreateCompatibleDC()
+    try:
+        mem_dc.SelectObject(bitmap)
+        bitmap.SaveBitmapFile(mem_dc, temp_bmp)
+    finally:
+        try:
+            mem_dc.DeleteDC()
+        except:
+            pass
+        try:
+            dc.DeleteDC()
+        except:
+            pass
+    if not os.path.exists(temp_bmp):
+        return None
+    img = Image.open(temp_bmp)
+    img.load()
+    os.remove(temp_bmp)
+    return img
+
+def _radial_gradient_np(size):
+    w, h = size
+    r = w / 2
+    j, i = np.indices((h, w), dtype=np.float64)
+    dist = np.hypot(i - w / 2, j - h / 2)
+    t = dist / r
+    inside = dist < r
+    arr = np.empty((h, w, 4), np.uint8)
+    arr[..., 0] = np.where(inside, 100 + 100 * t, 40).astype(np.uint8)
+    arr[..., 1] = np.where(inside, 80 + 80 * t, 40).astype(np.uint8)
+    arr[..., 2] = np.where(inside, 180 + 75 * t, 40).astype(np.uint8)
+    arr[..., 3] = 255
+    return Image.fromarray(arr, 'RGBA')
+
+_FONTS_DIR = os.path.join(os.environ.get("WINDIR", "C:\\Windows"), "Fonts")
+# absolute paths first: an exists() check is cheaper than PIL's font search + raise
+_FONT_PATHS = [os.path.join(_FONTS_DIR, name) for name in ("Arial.ttf", "SegoeUI.ttf", "Tahoma.ttf")]
+_FONT_PATHS += ["arial.ttf", "segoeui.ttf"]
+_font_cache = {}
+_default_font = None
+
+def _get_font(font_size):
+    """First loadable font from _FONT_PATHS at font_size; faces are parsed once per size."""
+    global _default_font
+    font = _font_cache.get(font_size)
+    if font is not None:
+        return font
+    for path in _FONT_PATHS:
+        if os.path.isabs(path) and not os.path.exists(path):
+            continue
+        try:
+            font = ImageFont.truetype(path, font_size)
+            break
+        except OSError:
+            continue
+    if font is None:
+        if _default_font is None:
+            _default_font = ImageFont.load_default()
+        font = _default_font
+    _font_cache[font_size] = font
+    return font
+
+_bbox_cache = {}
+
+def _glyph_size(letter, font_size, font):
+    """(width, height) of a single glyph; cached since placeholders reuse a handful of letters."""
+    key = (letter, font_size)
+    wh = _bbox_cache.get(key)
+    if wh is None:
+        if hasattr(font, 'getbbox'):
+            bbox = font.getbbox(letter)
+            wh = (bbox[2] - bbox[0], bbox[3] - bbox[1])
+        else:  # Pillow < 9.2
+            wh = font.getsize(letter)
+        _bbox_cache[key] = wh
+    return wh
+
+def _radial_gradient_pil(size):
+    # NumPy-less fallback: Image.radial_gradient is a 256x256 distance field (value = dist * sqrt(2)),
+    # mapped to the disc colours through 256-entry LUTs. Approximate: the 8-bit field is resampled, so about half
+    # the pixels differ from the NumPy path by 1-3 levels, and pixels on the disc edge can land on the other side.
+    w, h = size
+    field = Image.new('L', (w, h), 255)
+    field.paste(Image.radial_gradient('L').resize((w, w), Image.Resampling.BILINEAR), (0, (h - w) // 2))
+    ts = [v * math.sqrt(2) / 255 for v in range(256)]
+    lut_r = [int(100 + 100 * t) if t < 1 else 40 for t in ts]
+    lut_g = [int(80 + 80 * t) if t < 1 else 40 for t in ts]
+    lut_b = [int(180 + 75 * t) if t < 1 else 40 for t in ts]
+    alpha = Image.new('L', (w, h), 255)
+    return Image.merge('RGBA', (field.point(lut_r), field.point(lut_g), field.point(lut_b), alpha))
+
+@functools.lru_cache(maxsize=8)
+def _gradient_base(size):
+    """RGBA bytes of the placeholder background; only the letter differs between icons."""
+    img = _radial_gradient_np(size) if _load_numpy() is not None else _radial_gradient_pil(size)
+    return img.tobytes()
+
 def create_placeholder_icon(output_path, size, exe_path):
-    img = Image.new('RGBA', size, (40, 40, 40, 255))
+    _load_pil()
+    size = tuple(size)
+    img = Image.frombytes('RGBA', size, _gradient_base(size))
     draw = ImageDraw.Draw(img)
-    for i in range(size[0]):
-        for j in range(size[1]):
-            x = i - size[0] / 2
-            y = j - size[1] / 2
-            dist = (x*x + y*y)**0.5
-            if dist < size[0]/2:
-                color = (
-                    int(100 + 100 * (dist / (size[0]/2))),
-                    int(80 + 80 * (dist / (size[0]/2))),
-                    int(180 + 75 * (dist / (size[0]/2)))
-                )
-                draw.point((i, j), fill=color)
     game_name = os.path.basename(exe_path).replace('.exe', '').replace('.EXE', '')
     if game_name:
         try:
             font_size = size[0] // 2
-            font = None
-            font_paths = ["arial.ttf", "segoeui.ttf", "C:\\Windows\\Fonts\\Arial.ttf",
-                          "C:\\Windows\\Fonts\\SegoeUI.ttf", "C:\\Windows\\Fonts\\Tahoma.ttf"]
-            for path in font_paths:
-                try:
-                    font = ImageFont.truetype(path, font_size)
-                    break
-                except:
-                    continue
-            if font is None:
-                font = ImageFont.load_default()
-            try:
-                bbox = draw.textbbox((0,0), game_name[0].upper(), font=font)
-                text_width = bbox[2] - bbox[0]
-                text_height = bbox[3] - bbox[1]
-            except AttributeError:
-                text_width, text_height = draw.textsize(game_name[0].upper(), font=font)
+            font = _get_font(font_size)
+            letter = game_name[0].upper()
+            text_width, text_height = _glyph_size(letter, font_size, font)
             x = (size[0] - text_width) // 2
             y = (size[1] - text_height) // 2
-            draw.text((x, y), game_name[0].upper(), fill='white', font=font)
+            draw.text((x, y), letter, fill='white', font=font)
         except:
             draw.ellipse([size[0]//2-10, size[1]//2-10, size[0]//2+10, size[1]//2+10], fill='white')
     img.save(output_path, "PNG")
@@ -135,58 +309,78 @@ def create_placeholder_icon(output_path, size, exe_path):
 def load_games():
     if not os.path.exists(DATA_FILE):
         return {}
-    with open(DATA_FILE, "r", encoding="utf-8") as f:
-        games = json.load(f)
+    games = _read_json(DATA_FILE)
 
     # Гарантируем, что monitor_profiles - словарь
-    for game in games.values():
-        if "monitor_profiles" not in game or not isinstance(game["monitor_profiles"], dict):
-            game["monitor_profiles"] = {}
-
-    global_monitors = load_monitors()
-    changed = False
+    global_monitors = None  # loaded only if a custom_name needs migrating
+    games_changed = False
+    monitors_changed = False
 
     for game in games.values():
-        monitor_profiles = game.get("monitor_profiles", {})
-        for mon_key, profile in list(monitor_profiles.items()):
+        monitor_profiles = game.get("monitor_profiles")
+        if not isinstance(monitor_profiles, dict):
+            monitor_profiles = game["monitor_profiles"] = {}
+            games_changed = True
+        for mon_key, profile in monitor_profiles.items():
             if "monitor_id" not in profile:
                 try:
                     mon_id = int(mon_key.split('_')[-1])
                     profile["monitor_id"] = str(mon_id)
                 except:
                     profile["monitor_id"] = "0"
+                games_changed = True
             if "custom_name" in profile and profile["custom_name"]:
+                if global_monitors is None:
+                    global_monitors = load_monitors()
                 mon_id = profile["monitor_id"]
                 if mon_id not in global_monitors:
                     global_monitors[mon_id] = profile["custom_name"]
-                    changed = True
+                    monitors_changed = True
                 del profile["custom_name"]
+                games_changed = True
         if "poster_path" not in game:
             game["poster_path"] = ""
+            games_changed = True
         if "play_time" not in game:
             game["play_time"] = "0h"
+            games_changed = True
 
-    if changed:
+    if monitors_changed:
         save_monitors(global_monitors)
+    if games_changed:
         save_games(games)
     return games
 
+def _read_json(path):
+    with open(path, "rb") as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+def _atomic_write_json(path, data):
+    # one buffered write to a sibling + rename: a crash never leaves a truncated file
+    if orjson is not None:
+        raw = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        raw = json.dumps(data, ensure_ascii=False, indent=4).encode("utf-8")
+    tmp = path + ".tmp"
+    with open(tmp, "wb", buffering=1 << 16) as f:
+        f.write(raw)
+    os.replace(tmp, path)
+
 def save_games(games):
-    with open(DATA_FILE, "w", encoding="utf-8") as f:
-        json.dump(games, f, ensure_ascii=False, indent=4)
+    _atomic_write_json(DATA_FILE, games)
 
 def load_monitors():
     if not os.path.exists(MONITORS_FILE):
         return {}
     try:
-        with open(MONITORS_FILE, "r", encoding="utf-8") as f:
+        with open(MONITORS_FILE, "rb") as f:
             content = f.read().strip()
-            if not content:
-                return {}
-            return json.loads(content)
+        if not content:
+            return {}
+        return orjson.loads(content) if orjson is not None else json.loads(content)
     except (json.JSONDecodeError, IOError):
         return {}
 
 def save_monitors(monitors):
-    with open(MONITORS_FILE, "w", encoding="utf-8") as f:
-        json.dump(monitors, f, ensure_ascii=False, indent=4)
\ No newline at end of file
+    _atomic_write_json(MONITORS_FILE, monitors)
\ No newline at end of file
@@ -37,4 +37,42 @@ if xinput_dll:
 else:
     XInputGetState = None
     ERROR_SUCCESS = 0
-    ERROR_DEVICE_NOT_CONNECTED = 1167
\ No newline at end of file
+    ERROR_DEVICE_NOT_CONNECTED = 1167
+
+# reused by poll(); avoids a Structure allocation per frame in polling loops
+_STATE_BUF = XINPUT_STATE()
+_PSTATE = ctypes.byref(_STATE_BUF)
+
+def poll(index):
+    """
+    Read controller `index` into a shared buffer.
+    Returns the XINPUT_STATE (valid until the next poll() call) or None if unavailable.
+    Not thread-safe: meant for a single polling thread.
+    """
+    if XInputGetState is None:
+        return None
+    if XInputGetState(index, _PSTATE) != ERROR_SUCCESS:
+        return None
+    return _STATE_BUF
+
+# XInputGetState on an empty slot is slow on many drivers; re-probe those at most once a second
+DISCONNECTED_RETRY = 1.0
+_disconnected_until = [0.0] * 4
+
+def poll_all(now):
+    """
+    Poll all 4 slots, skipping ones seen disconnected within DISCONNECTED_RETRY seconds.
+    `now` is a time.monotonic() timestamp. Returns [(index, XINPUT_STATE copy)] for connected pads.
+    """
+    if XInputGetState is None:
+        return []
+    out = []
+    for i in range(4):
+        if now < _disconnected_until[i]:
+            continue
+        res = XInputGetState(i, _PSTATE)
+        if res == ERROR_SUCCESS:
+            out.append((i, XINPUT_STATE.from_buffer_copy(_STATE_BUF)))
+        elif res == ERROR_DEVICE_NOT_CONNECTED:
+            _disconnected_until[i] = now + DISCONNECTED_RETRY
+    return out
\ No newline at end of file